@@ -2,63 +2,411 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from pymongo.collection import Collection
 
 from travel_pipeline.core.config import Settings, get_settings
+from travel_pipeline.core.kernels import segment_mean
 from travel_pipeline.core.logging import configure_logging
-from travel_pipeline.db.mongo import get_collection, get_mongo_client
+from travel_pipeline.db.mongo import bulk_insert, get_collection, get_mongo_client
+
+try:
+    # Optional accelerator: multi-threaded, Arrow-native group-bys.
+    import polars as pl
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pl = None  # type: ignore[assignment]
+
+
+def _use_polars() -> bool:
+    """Return True when the Polars fast path is installed and enabled."""
+
+    return pl is not None and get_settings().use_polars
+
+
+def _carrier_summary_numba(frame: pd.DataFrame) -> pd.DataFrame:
+    """Carrier/day KPIs via factorized keys and JIT segment reductions.
+
+    Factorizing the composite key once and running the compiled kernels per
+    metric avoids pandas' per-column group-by dispatch entirely.
+    """
+
+    # Drop rows with a null key up front, as the pandas groupby does: the
+    # factorized codes would otherwise route them into a spurious group.
+    valid = frame["carrier"].notna() & frame["flight_date"].notna()
+    if not valid.all():
+        frame = frame[valid]
+    keys = pd.MultiIndex.from_arrays([frame["carrier"], frame["flight_date"]])
+    codes, uniques = keys.factorize()
+    # Belt and braces: factorize marks any remaining null key as -1, which
+    # would index the kernel's accumulators from the wrong end.
+    present = codes >= 0
+    codes = codes[present].astype(np.int64)
+    n_groups = len(uniques)
+
+    def column(name: str) -> np.ndarray:
+        return pd.to_numeric(frame[name], errors="coerce").to_numpy(np.float64)[present]
+
+    return pd.DataFrame(
+        {
+            "carrier": uniques.get_level_values(0),
+            "flight_date": uniques.get_level_values(1),
+            "avg_arr_delay": segment_mean(codes, column("arr_delay"), n_groups),
+            "avg_dep_delay": segment_mean(codes, column("dep_delay"), n_groups),
+            "flights": np.bincount(codes, minlength=n_groups),
+            "cancel_rate": segment_mean(codes, column("cancelled"), n_groups),
+        }
+    )
 
 
 def carrier_month_summary(frame: pd.DataFrame) -> pd.DataFrame:
     # Aggregate by carrier and flight_date (day) to provide daily KPI trends.
     # Ensure 'flight_date' is present and formatted as string for Streamlit compatibility
-    frame = frame.copy()
+    # assign() copies only the one mutated column instead of the whole frame.
     if pd.api.types.is_datetime64_any_dtype(frame["flight_date"]):
-        frame["flight_date"] = frame["flight_date"].dt.strftime("%Y-%m-%d")
-    group = (
-        frame.groupby(["carrier", "flight_date"], as_index=False)
-        .agg(
-            avg_arr_delay=("arr_delay", "mean"),
-            avg_dep_delay=("dep_delay", "mean"),
-            flights=("flight_date", "count"),
-            cancel_rate=("cancelled", "mean"),
+        frame = frame.assign(flight_date=frame["flight_date"].dt.strftime("%Y-%m-%d"))
+    if _use_polars():
+        group = (
+            pl.from_pandas(frame)
+            .group_by(["carrier", "flight_date"])
+            .agg(
+                pl.col("arr_delay").mean().alias("avg_arr_delay"),
+                pl.col("dep_delay").mean().alias("avg_dep_delay"),
+                pl.len().alias("flights"),
+                pl.col("cancelled").mean().alias("cancel_rate"),
+            )
+            .to_pandas()
         )
-        .round(2)
-    )
-    return group
+    elif segment_mean is not None:
+        group = _carrier_summary_numba(frame)
+    else:
+        # Plain Series reducers keep pandas on its Cython fast paths instead of
+        # the named-agg dispatch; sort=False skips an unnecessary key sort.
+        grouped = frame.groupby(["carrier", "flight_date"], sort=False, observed=True)
+        group = pd.DataFrame(
+            {
+                "avg_arr_delay": grouped["arr_delay"].mean(),
+                "avg_dep_delay": grouped["dep_delay"].mean(),
+                "flights": grouped.size(),
+                "cancel_rate": grouped["cancelled"].mean(),
+            }
+        ).reset_index()
+    return group.round(2)
 
 
 def origin_cancel_summary(frame: pd.DataFrame) -> pd.DataFrame:
     # Highlight stations that struggle with cancellations.
-    group = (
-        frame.groupby("origin", as_index=False)
-        .agg(
-            cancel_rate=("cancelled", "mean"),
-            flights=("flight_date", "count"),
+    if _use_polars():
+        group = (
+            pl.from_pandas(frame)
+            .group_by("origin")
+            .agg(
+                pl.col("cancelled").mean().alias("cancel_rate"),
+                pl.len().alias("flights"),
+            )
+            .to_pandas()
         )
-        .round(3)
-        .sort_values("cancel_rate", ascending=False)
+    else:
+        grouped = frame.groupby("origin", sort=False, observed=True)
+        group = pd.DataFrame(
+            {
+                "cancel_rate": grouped["cancelled"].mean(),
+                "flights": grouped.size(),
+            }
+        ).reset_index()
+    return group.round(3).sort_values("cancel_rate", ascending=False)
+
+
+DOW_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+
+def carrier_ontime_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    # League-table rollup consumed directly by the benchmarking view.
+    on_time = pd.to_numeric(frame["arr_delay"], errors="coerce").le(15)
+    grouped = frame.assign(on_time=on_time).groupby("carrier", sort=False, observed=True)
+    group = pd.DataFrame(
+        {
+            "on_time_rate": grouped["on_time"].mean(),
+            "flights": grouped.size(),
+        }
+    ).reset_index()
+    return group.round(3).sort_values("on_time_rate", ascending=False)
+
+
+def dow_cancel_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    # Cancellation rate per weekday, pre-sorted Monday through Sunday.
+    dow = pd.Categorical(
+        pd.to_datetime(frame["flight_date"]).dt.day_name(), categories=DOW_NAMES, ordered=True
     )
+    grouped = frame.assign(dow=dow).groupby("dow", sort=False, observed=True)
+    group = pd.DataFrame(
+        {
+            "cancel_rate": grouped["cancelled"].mean(),
+            "flights": grouped.size(),
+        }
+    ).reset_index()
+    group["dow"] = group["dow"].astype(str)
+    return group.round(3).sort_values("flights", ascending=False)
+
+
+def daily_volume_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    # Flights per calendar day across all carriers.
+    days = pd.to_datetime(frame["flight_date"]).dt.strftime("%Y-%m-%d")
+    group = days.value_counts().rename_axis("flight_date").reset_index(name="flights")
+    return group.sort_values("flight_date")
+
+
+def pareto_origin_summary(frame: pd.DataFrame) -> pd.DataFrame:
+    # Positive delay minutes per origin with the cumulative Pareto share.
+    delays = pd.to_numeric(frame["arr_delay"], errors="coerce")
+    subset = frame.assign(arr_delay_num=delays)[delays > 0]
+    grouped = subset.groupby("origin", sort=False, observed=True)
+    group = pd.DataFrame({"delay_minutes": grouped["arr_delay_num"].sum()}).reset_index()
+    group = group.sort_values("delay_minutes", ascending=False)
+    group["cum_share"] = (group["delay_minutes"].cumsum() / group["delay_minutes"].sum()).round(4)
     return group
 
 
 def route_delay_summary(frame: pd.DataFrame) -> pd.DataFrame:
     # Focus on origin/destination pairs to spotlight route-level congestion.
-    group = (
-        frame.groupby(["origin", "destination"], as_index=False)
-        .agg(
-            avg_dep_delay=("dep_delay", "mean"),
-            avg_arr_delay=("arr_delay", "mean"),
-            flights=("flight_date", "count"),
+    if _use_polars():
+        group = (
+            pl.from_pandas(frame)
+            .group_by(["origin", "destination"])
+            .agg(
+                pl.col("dep_delay").mean().alias("avg_dep_delay"),
+                pl.col("arr_delay").mean().alias("avg_arr_delay"),
+                pl.len().alias("flights"),
+            )
+            .to_pandas()
         )
-        .round(2)
-        .sort_values("avg_arr_delay", ascending=False)
-    )
-    return group
+    else:
+        grouped = frame.groupby(["origin", "destination"], sort=False, observed=True)
+        group = pd.DataFrame(
+            {
+                "avg_dep_delay": grouped["dep_delay"].mean(),
+                "avg_arr_delay": grouped["arr_delay"].mean(),
+                "flights": grouped.size(),
+            }
+        ).reset_index()
+    # Materialize the display label once per route here so the dashboard
+    # never concatenates strings row by row in its render path.
+    group["route"] = group["origin"].astype(str) + " → " + group["destination"].astype(str)
+    return group.round(2).sort_values("avg_arr_delay", ascending=False)
+
+
+# Server-side equivalents of the pandas summaries. Each facet reduces the
+# clean collection inside MongoDB so only aggregate rows cross the wire.
+CARRIER_FACET = [
+    {
+        "$group": {
+            "_id": {
+                "carrier": "$carrier",
+                "flight_date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$flight_date"}},
+            },
+            "avg_arr_delay": {"$avg": "$arr_delay"},
+            "avg_dep_delay": {"$avg": "$dep_delay"},
+            "flights": {"$sum": 1},
+            "cancel_rate": {"$avg": {"$cond": ["$cancelled", 1, 0]}},
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "carrier": "$_id.carrier",
+            "flight_date": "$_id.flight_date",
+            "avg_arr_delay": {"$round": ["$avg_arr_delay", 2]},
+            "avg_dep_delay": {"$round": ["$avg_dep_delay", 2]},
+            "flights": 1,
+            "cancel_rate": {"$round": ["$cancel_rate", 2]},
+        }
+    },
+]
+ORIGIN_FACET = [
+    {
+        "$group": {
+            "_id": "$origin",
+            "cancel_rate": {"$avg": {"$cond": ["$cancelled", 1, 0]}},
+            "flights": {"$sum": 1},
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "origin": "$_id",
+            "cancel_rate": {"$round": ["$cancel_rate", 3]},
+            "flights": 1,
+        }
+    },
+    {"$sort": {"cancel_rate": -1}},
+]
+ROUTE_FACET = [
+    {
+        "$group": {
+            "_id": {"origin": "$origin", "destination": "$destination"},
+            "avg_dep_delay": {"$avg": "$dep_delay"},
+            "avg_arr_delay": {"$avg": "$arr_delay"},
+            "flights": {"$sum": 1},
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "origin": "$_id.origin",
+            "destination": "$_id.destination",
+            "route": {"$concat": ["$_id.origin", " → ", "$_id.destination"]},
+            "avg_dep_delay": {"$round": ["$avg_dep_delay", 2]},
+            "avg_arr_delay": {"$round": ["$avg_arr_delay", 2]},
+            "flights": 1,
+        }
+    },
+    {"$sort": {"avg_arr_delay": -1}},
+]
+CARRIER_ONTIME_FACET = [
+    {
+        "$group": {
+            "_id": "$carrier",
+            "on_time_rate": {"$avg": {"$cond": [{"$lte": ["$arr_delay", 15]}, 1, 0]}},
+            "flights": {"$sum": 1},
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "carrier": "$_id",
+            "on_time_rate": {"$round": ["$on_time_rate", 3]},
+            "flights": 1,
+        }
+    },
+    {"$sort": {"on_time_rate": -1}},
+]
+DOW_CANCEL_FACET = [
+    {
+        "$group": {
+            "_id": {"$dayOfWeek": "$flight_date"},
+            "cancel_rate": {"$avg": {"$cond": ["$cancelled", 1, 0]}},
+            "flights": {"$sum": 1},
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            # $dayOfWeek is 1-indexed starting on Sunday.
+            "dow": {
+                "$arrayElemAt": [
+                    ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"],
+                    {"$subtract": ["$_id", 1]},
+                ]
+            },
+            "cancel_rate": {"$round": ["$cancel_rate", 3]},
+            "flights": 1,
+        }
+    },
+    {"$sort": {"flights": -1}},
+]
+DAILY_VOLUME_FACET = [
+    {
+        "$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$flight_date"}},
+            "flights": {"$sum": 1},
+        }
+    },
+    {"$project": {"_id": 0, "flight_date": "$_id", "flights": 1}},
+    {"$sort": {"flight_date": 1}},
+]
+PARETO_ORIGIN_FACET = [
+    {"$match": {"arr_delay": {"$gt": 0}}},
+    {"$group": {"_id": "$origin", "delay_minutes": {"$sum": "$arr_delay"}}},
+    {"$sort": {"delay_minutes": -1}},
+    # Window sums give the running and grand totals for the Pareto share.
+    {
+        "$setWindowFields": {
+            "sortBy": {"delay_minutes": -1},
+            "output": {
+                "cum_minutes": {
+                    "$sum": "$delay_minutes",
+                    "window": {"documents": ["unbounded", "current"]},
+                },
+                "total_minutes": {
+                    "$sum": "$delay_minutes",
+                    "window": {"documents": ["unbounded", "unbounded"]},
+                },
+            },
+        }
+    },
+    {
+        "$project": {
+            "_id": 0,
+            "origin": "$_id",
+            "delay_minutes": 1,
+            "cum_share": {"$round": [{"$divide": ["$cum_minutes", "$total_minutes"]}, 4]},
+        }
+    },
+]
+
+
+def _frame_documents(frame: pd.DataFrame) -> Iterator[Dict]:
+    """Stream insert documents with itertuples instead of to_dict("records").
+
+    One columnwise astype(object) pass converts numpy scalars to BSON-safe
+    Python values; the rows are then assembled lazily with plain zips, so
+    the full list of dicts never exists alongside the frame.
+    """
+
+    columns = frame.columns.tolist()
+    for row in frame.astype(object).itertuples(index=False, name=None):
+        yield dict(zip(columns, row))
+
+
+def _shrink_for_groupby(frame: pd.DataFrame) -> pd.DataFrame:
+    """Downcast the clean frame so group-by keys and values stay compact.
+
+    Category codes hash as small integers instead of Python strings, and
+    downcast floats halve the memory traffic of the delay reductions.
+    """
+
+    for column in ("carrier", "origin", "destination"):
+        if column in frame:
+            frame[column] = frame[column].astype("category")
+    for column in ("arr_delay", "dep_delay", "taxi_out", "taxi_in"):
+        if column in frame:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce", downcast="float")
+    return frame
+
+
+def _aggregate_server_side(
+    clean_collection: Collection, targets: Dict[str, Collection], insert_batch_size: int = 1_000
+) -> Dict[str, int]:
+    """Run every gold summary in one $facet pipeline and store the results."""
+
+    facets = {
+        "carrier": CARRIER_FACET,
+        "origin": ORIGIN_FACET,
+        "route": ROUTE_FACET,
+        "carrier_ontime": CARRIER_ONTIME_FACET,
+        "dow_cancel": DOW_CANCEL_FACET,
+        "daily_volume": DAILY_VOLUME_FACET,
+        "pareto_origin": PARETO_ORIGIN_FACET,
+    }
+    result = next(clean_collection.aggregate([{"$facet": facets}], allowDiskUse=True))
+    counts: Dict[str, int] = {}
+    for name, collection in targets.items():
+        documents = result[name]
+        if documents:
+            bulk_insert(collection, documents, insert_batch_size)
+        counts[name] = len(documents)
+    return counts
 
 
 def run_aggregate(settings: Settings | None = None) -> Dict[str, int]:
@@ -67,28 +415,47 @@ def run_aggregate(settings: Settings | None = None) -> Dict[str, int]:
     client = get_mongo_client(settings)
     clean_collection = get_collection(client, settings.clean_collection, settings)
 
-    carrier_collection = get_collection(client, settings.agg_carrier_collection, settings)
-    origin_collection = get_collection(client, settings.agg_origin_collection, settings)
-    route_collection = get_collection(client, settings.agg_route_collection, settings)
+    targets = {
+        "carrier": get_collection(client, settings.agg_carrier_collection, settings),
+        "origin": get_collection(client, settings.agg_origin_collection, settings),
+        "route": get_collection(client, settings.agg_route_collection, settings),
+        "carrier_ontime": get_collection(client, settings.agg_carrier_ontime_collection, settings),
+        "dow_cancel": get_collection(client, settings.agg_dow_cancel_collection, settings),
+        "daily_volume": get_collection(client, settings.agg_daily_volume_collection, settings),
+        "pareto_origin": get_collection(client, settings.agg_pareto_origin_collection, settings),
+    }
+    for collection in targets.values():
+        collection.drop()
 
-    carrier_collection.drop()
-    origin_collection.drop()
-    route_collection.drop()
+    if settings.server_side_aggregation:
+        # The facet output is already in its final shape, so read it as raw
+        # BSON and hand the undecoded documents straight to the inserts.
+        counts = _aggregate_server_side(
+            get_collection(client, settings.clean_collection, settings, raw=True),
+            targets,
+            settings.insert_batch_size,
+        )
+        logger.info("Aggregations complete", counts=counts)
+        return counts
 
     frame = pd.DataFrame(list(clean_collection.find({}, projection={"_id": 0})))
     if frame.empty:
         logger.warning("Clean collection is empty; skipping aggregation stage")
-        return {"carrier": 0, "origin": 0, "route": 0}
+        return {name: 0 for name in targets}
+    frame = _shrink_for_groupby(frame)
 
     summaries = {
         "carrier": carrier_month_summary(frame),
         "origin": origin_cancel_summary(frame),
         "route": route_delay_summary(frame),
+        "carrier_ontime": carrier_ontime_summary(frame),
+        "dow_cancel": dow_cancel_summary(frame),
+        "daily_volume": daily_volume_summary(frame),
+        "pareto_origin": pareto_origin_summary(frame),
     }
 
-    carrier_collection.insert_many(summaries["carrier"].to_dict("records"))
-    origin_collection.insert_many(summaries["origin"].to_dict("records"))
-    route_collection.insert_many(summaries["route"].to_dict("records"))
+    for name, summary in summaries.items():
+        bulk_insert(targets[name], _frame_documents(summary), settings.insert_batch_size)
 
     logger.info("Aggregations complete", counts={k: len(v) for k, v in summaries.items()})
     return {key: len(value) for key, value in summaries.items()}
@@ -4,10 +4,7 @@ from __future__ import annotations
 
 import argparse
 
-from travel_pipeline.aggregate.pipeline import run_aggregate as run_aggregate_stage
-from travel_pipeline.clean.pipeline import run_clean as run_clean_stage
 from travel_pipeline.core.logging import configure_logging
-from travel_pipeline.ingest.pipeline import ingest_raw
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -24,13 +21,20 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: list[str] | None = None) -> None:
     configure_logging()
     args = build_parser().parse_args(argv)
+    # Import stages lazily so each command only pays for the modules it runs.
     if args.command == "ingest":
+        from travel_pipeline.ingest.pipeline import ingest_raw
+
         summary = ingest_raw()
         print(summary)
     elif args.command == "clean":
+        from travel_pipeline.clean.pipeline import run_clean as run_clean_stage
+
         inserted = run_clean_stage()
         print({"clean_rows": inserted})
     elif args.command == "aggregate":
+        from travel_pipeline.aggregate.pipeline import run_aggregate as run_aggregate_stage
+
         summary = run_aggregate_stage()
         print(summary)
 
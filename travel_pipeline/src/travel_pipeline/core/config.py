@@ -30,6 +30,11 @@ def _int_env(key: str, default: int) -> int:
     return int(value) if value else default
 
 
+def _bool_env(key: str, default: bool) -> bool:
+    value = os.getenv(key)
+    return value.strip().lower() in {"1", "true", "yes", "on"} if value else default
+
+
 class Settings(BaseModel):
     """Typed representation of environment configuration."""
 
@@ -43,9 +48,28 @@ class Settings(BaseModel):
     agg_carrier_collection: str = Field(default=os.getenv("AGG_CARRIER_COLLECTION", "agg_carrier_month"))
     agg_origin_collection: str = Field(default=os.getenv("AGG_ORIGIN_COLLECTION", "agg_origin_cancel"))
     agg_route_collection: str = Field(default=os.getenv("AGG_ROUTE_COLLECTION", "agg_route_delay"))
+    agg_carrier_ontime_collection: str = Field(
+        default=os.getenv("AGG_CARRIER_ONTIME_COLLECTION", "agg_carrier_ontime")
+    )
+    agg_dow_cancel_collection: str = Field(default=os.getenv("AGG_DOW_CANCEL_COLLECTION", "agg_dow_cancel"))
+    agg_daily_volume_collection: str = Field(
+        default=os.getenv("AGG_DAILY_VOLUME_COLLECTION", "agg_daily_volume")
+    )
+    agg_pareto_origin_collection: str = Field(
+        default=os.getenv("AGG_PARETO_ORIGIN_COLLECTION", "agg_pareto_origin")
+    )
     metadata_collection: str = Field(default=os.getenv("METADATA_COLLECTION", "metadata"))
+    server_side_aggregation: bool = Field(
+        default_factory=lambda: _bool_env("SERVER_SIDE_AGGREGATION", True),
+        description="Compute gold summaries inside MongoDB instead of shipping the clean collection to pandas",
+    )
+    use_polars: bool = Field(
+        default_factory=lambda: _bool_env("USE_POLARS", True),
+        description="Run gold aggregations through Polars when it is installed",
+    )
     chunk_size: int = Field(default_factory=lambda: _int_env("CHUNK_SIZE", 100_000), ge=10_000)
     batch_size: int = Field(default_factory=lambda: _int_env("BATCH_SIZE", 50_000), ge=5_000)
+    insert_batch_size: int = Field(default_factory=lambda: _int_env("INSERT_BATCH_SIZE", 1_000), ge=100)
     jan_file: Path = Field(default_factory=lambda: _path_env("JAN_FILE", PROJECT_ROOT / "data" / "JAN_DATA.csv"))
     feb_file: Path = Field(default_factory=lambda: _path_env("FEB_FILE", PROJECT_ROOT / "data" / "FEB_DATA.csv"))
 
@@ -0,0 +1,42 @@
+"""Optional JIT-compiled reduction kernels shared across stages.
+
+The aggregation stage and the dashboard both need a NaN-aware mean per
+factorized group code; keeping the single kernel here stops the two
+copies from drifting. ``segment_mean`` is ``None`` when numba is not
+installed, so callers guard with ``if segment_mean is not None``.
+
+Callers must mask out ``-1`` codes (factorize's marker for null keys)
+before invoking the kernel — a negative code would index the
+accumulators from the wrong end.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    import numba as nb
+except ImportError:  # pragma: no cover - exercised only without the extra
+    nb = None  # type: ignore[assignment]
+
+
+if nb is not None:
+
+    @nb.njit(cache=True)
+    def segment_mean(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+        """NaN-aware mean per group code, compiled to a single native loop."""
+
+        sums = np.zeros(n_groups, dtype=np.float64)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(codes.size):
+            value = values[i]
+            if not np.isnan(value):
+                sums[codes[i]] += value
+                counts[codes[i]] += 1
+        means = np.empty(n_groups, dtype=np.float64)
+        for group in range(n_groups):
+            means[group] = sums[group] / counts[group] if counts[group] else np.nan
+        return means
+
+else:  # pragma: no cover - exercised only without the extra
+    segment_mean = None  # type: ignore[assignment]
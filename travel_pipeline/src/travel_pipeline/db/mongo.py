@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable
+
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import ServerSelectionTimeoutError
+from pymongo.write_concern import WriteConcern
 
 from travel_pipeline.core.config import Settings, get_settings
 from travel_pipeline.core.logging import get_logger
@@ -13,11 +21,11 @@ from travel_pipeline.core.logging import get_logger
 logger = get_logger(module="mongo")
 
 
-def get_mongo_client(settings: Settings | None = None) -> MongoClient:
-    """Instantiate a Mongo client with a conservative timeout."""
+@lru_cache(maxsize=4)
+def _client_for_uri(uri: str, pid: int) -> MongoClient:
+    """Build and ping one client per URI so stages share a connection pool."""
 
-    settings = settings or get_settings()
-    client = MongoClient(settings.mongodb_uri, serverSelectionTimeoutMS=5_000)
+    client = MongoClient(uri, serverSelectionTimeoutMS=5_000, maxPoolSize=64, retryWrites=True)
     try:
         client.admin.command("ping")
     except ServerSelectionTimeoutError as exc:
@@ -26,11 +34,56 @@ def get_mongo_client(settings: Settings | None = None) -> MongoClient:
     return client
 
 
+def get_mongo_client(settings: Settings | None = None) -> MongoClient:
+    """Return a cached Mongo client keyed on the connection URI.
+
+    Running several stages in one interpreter reuses the pool and skips the
+    per-stage handshake; the pid in the cache key keeps forked ingest
+    workers from inheriting a parent's sockets.
+    """
+
+    settings = settings or get_settings()
+    return _client_for_uri(settings.mongodb_uri, os.getpid())
+
+
 def get_database(client: MongoClient, settings: Settings | None = None) -> Database:
     settings = settings or get_settings()
     return client[settings.database]
 
 
-def get_collection(client: MongoClient, name: str, settings: Settings | None = None) -> Collection:
+def get_collection(
+    client: MongoClient, name: str, settings: Settings | None = None, raw: bool = False
+) -> Collection:
+    """Return a collection handle.
+
+    With raw=True documents are decoded as RawBSONDocument, skipping dict
+    construction for callers that only pass results through to another
+    collection untouched.
+    """
+
     database = get_database(client, settings)
+    if raw:
+        return database.get_collection(
+            name, codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
     return database[name]
+
+
+def bulk_insert(collection: Collection, documents: Iterable[Dict], batch_size: int = 1_000) -> int:
+    """Insert documents in unordered, unacknowledged batches.
+
+    The pipeline's bulk loads target freshly dropped collections, so
+    fire-and-forget writes (w=0) with unordered batches are safe and avoid
+    waiting on a server ack per insert_many call. Accepting any iterable
+    lets callers stream documents instead of materializing a full list.
+    """
+
+    # bypass_document_validation is not allowed on unacknowledged writes
+    # (PyMongo raises), and these collections carry no validators anyway.
+    fast = collection.with_options(write_concern=WriteConcern(w=0))
+    iterator = iter(documents)
+    inserted = 0
+    while batch := list(islice(iterator, batch_size)):
+        fast.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    return inserted
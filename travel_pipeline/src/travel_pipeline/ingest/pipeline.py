@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from loguru import logger
 from pymongo.collection import Collection
 from pymongo.mongo_client import MongoClient
 
 from travel_pipeline.core.config import Settings, get_settings
 from travel_pipeline.core.logging import configure_logging
-from travel_pipeline.db.mongo import get_collection, get_mongo_client
+from travel_pipeline.db.mongo import bulk_insert, get_collection, get_mongo_client
+
+
+# Number of concurrent insert_many calls kept in flight per file.
+UPLOAD_WORKERS = 8
 
 
 def infer_schema(frame: pd.DataFrame) -> Dict[str, str]:
@@ -22,22 +29,32 @@ def infer_schema(frame: pd.DataFrame) -> Dict[str, str]:
 
 
 def chunk_csv(path: Path, chunk_size: int) -> Iterable[pd.DataFrame]:
-    """Yield pandas chunks while logging helpful progress info."""
+    """Stream Arrow record batches from a CSV and yield pandas chunks."""
 
     logger.info("Reading chunked CSV", file=str(path), chunk_size=chunk_size)
-    for chunk in pd.read_csv(path, chunksize=chunk_size, low_memory=False):
-        yield chunk
+    # Arrow's multi-threaded C++ reader sizes blocks in bytes, not rows.
+    read_options = pacsv.ReadOptions(block_size=chunk_size * 1024)
+    with pacsv.open_csv(path, read_options=read_options) as reader:
+        for batch in reader:
+            yield batch.to_pandas()
+
+
+def _iter_documents(table: pa.Table, slice_size: int = 10_000) -> Iterable[Dict]:
+    """Yield documents slice by slice so only one slice of dicts is alive."""
 
+    for start in range(0, table.num_rows, slice_size):
+        yield from table.slice(start, slice_size).to_pylist()
 
-def insert_chunk(chunk: pd.DataFrame, collection: Collection) -> int:
-    """Insert a pandas chunk into MongoDB after filling NaNs with None."""
 
-    # Pandas stores missing values as NaN which PyMongo cannot serialize, so convert to None.
-    documents = chunk.where(pd.notnull(chunk), None).to_dict("records")
-    if not documents:
+def insert_chunk(chunk: pd.DataFrame, collection: Collection, batch_size: int = 1_000) -> int:
+    """Insert a pandas chunk into MongoDB via an Arrow round trip."""
+
+    # Arrow nulls surface as Python None natively, so no NaN sweep is needed;
+    # the generator handoff keeps the chunk columnar until the driver needs rows.
+    table = pa.Table.from_pandas(chunk, preserve_index=False)
+    if table.num_rows == 0:
         return 0
-    collection.insert_many(documents)
-    return len(documents)
+    return bulk_insert(collection, _iter_documents(table), batch_size)
 
 
 def persist_metadata(
@@ -54,6 +71,29 @@ def persist_metadata(
     metadata_collection.insert_one(payload)
 
 
+def _ingest_one_file(csv_path: Path, settings: Settings) -> Tuple[int, Dict[str, str]]:
+    """Ingest a single CSV into the raw collection from a worker process."""
+
+    # Each worker needs its own client; MongoClient is not fork-safe.
+    client = get_mongo_client(settings)
+    raw_collection = get_collection(client, settings.raw_collection, settings)
+
+    inserted_total = 0
+    last_schema: Dict[str, str] = {}
+    # Several outstanding insert_many calls keep the server busy while the
+    # next chunks parse; the in-flight cap bounds how many chunks sit in RAM.
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as uploader:
+        pending = []
+        for chunk in chunk_csv(csv_path, settings.chunk_size):
+            pending.append(uploader.submit(insert_chunk, chunk, raw_collection, settings.insert_batch_size))
+            last_schema = infer_schema(chunk)
+            if len(pending) >= 2 * UPLOAD_WORKERS:
+                inserted_total += pending.pop(0).result()
+        for future in pending:
+            inserted_total += future.result()
+    return inserted_total, last_schema
+
+
 def ingest_raw(settings: Settings | None = None) -> Dict[str, int]:
     """Ingest every configured CSV into the raw Mongo collection."""
 
@@ -67,22 +107,23 @@ def ingest_raw(settings: Settings | None = None) -> Dict[str, int]:
     metadata_collection.drop()
 
     summary: Dict[str, int] = {}
-    for csv_path in settings.raw_files:
-        # Track rows per file so we can log and store them in the metadata collection.
-        inserted_total = 0
-        last_schema: Dict[str, str] = {}
-        for chunk in chunk_csv(csv_path, settings.chunk_size):
-            # Persist each chunk and remember the last schema snapshot for metadata.
-            inserted_total += insert_chunk(chunk, raw_collection)
-            last_schema = infer_schema(chunk)
-        persist_metadata(metadata_collection, csv_path, inserted_total, last_schema)
-        summary[csv_path.name] = inserted_total
-        logger.info(
-            "Finished raw ingestion",
-            file=csv_path.name,
-            rows=inserted_total,
-            collection=settings.raw_collection,
-        )
+    paths = settings.raw_files
+    if not paths:
+        return summary
+
+    # Source files are independent, so ingest them in parallel processes.
+    with ProcessPoolExecutor(max_workers=len(paths)) as pool:
+        futures = {pool.submit(_ingest_one_file, csv_path, settings): csv_path for csv_path in paths}
+        for future, csv_path in futures.items():
+            inserted_total, last_schema = future.result()
+            persist_metadata(metadata_collection, csv_path, inserted_total, last_schema)
+            summary[csv_path.name] = inserted_total
+            logger.info(
+                "Finished raw ingestion",
+                file=csv_path.name,
+                rows=inserted_total,
+                collection=settings.raw_collection,
+            )
     return summary
 
 
@@ -97,3 +138,11 @@ def attach_indexes(client: MongoClient, settings: Settings | None = None) -> Non
             ("DEST", 1),
         ]
     )
+    # Support the aggregation-stage group keys so $group / projected reads
+    # can walk an index instead of scanning full clean documents.
+    clean_collection = get_collection(client, settings.clean_collection, settings)
+    clean_collection.create_index([("flight_date", 1)])
+    clean_collection.create_index([("carrier", 1), ("flight_date", 1)])
+    clean_collection.create_index([("origin", 1)])
+    clean_collection.create_index([("origin", 1), ("destination", 1)])
+    clean_collection.create_index([("destination", 1)])
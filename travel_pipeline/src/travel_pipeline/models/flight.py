@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict
 
-import pandas as pd
+import ciso8601
 from pydantic import BaseModel, Field
 
+BTS_DATE_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
 
 class FlightRecord(BaseModel):
     """Validated representation of a cleaned BTS record."""
@@ -89,10 +92,28 @@ def _normalize_date(value: Any) -> datetime:
         return value
     if value is None:
         raise ValueError("FL_DATE cannot be null")
-    ts = pd.to_datetime(value, utc=True, errors="coerce")
-    if pd.isna(ts):
-        raise ValueError(f"Unable to parse FL_DATE value {value}")
-    return ts.to_pydatetime()
+    return _parse_date_string(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> datetime:
+    """Parse one date string with ciso8601, falling back to the BTS format.
+
+    ciso8601 handles ISO timestamps in C; the cache means repeated BTS date
+    strings only ever pay strptime once.
+    """
+
+    try:
+        parsed = ciso8601.parse_datetime(value)
+    except ValueError:
+        try:
+            parsed = datetime.strptime(value, BTS_DATE_FORMAT)
+        except ValueError as exc:
+            raise ValueError(f"Unable to parse FL_DATE value {value}") from exc
+    # Match the previous pd.to_datetime(utc=True) behavior for naive inputs.
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
 
 
 def _safe_upper(value: Any) -> str | None:
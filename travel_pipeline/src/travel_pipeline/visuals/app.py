@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import altair as alt
 
 from travel_pipeline.core.config import get_settings
+from travel_pipeline.core.kernels import segment_mean
 from travel_pipeline.db.mongo import get_mongo_client
 
+try:
+    # Optional accelerator: BSON decoded straight into Arrow columns.
+    from pymongoarrow.api import find_arrow_all
+except ImportError:  # pragma: no cover - exercised only without the extra
+    find_arrow_all = None  # type: ignore[assignment]
+
+try:
+    # Optional accelerator: sorted-key group-bys for the time-series views.
+    import polars as pl
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pl = None  # type: ignore[assignment]
+
+
 # Load configuration once so all views share the same MongoDB settings.
 settings = get_settings()
 
+# The clean stage stores these as numeric BSON, so a single cast when the
+# cache fills replaces the per-view pd.to_numeric passes on every rerun.
+# Group-by reductions are memory-bound, so the delay metrics land as
+# float32 and the flags as one-byte bools to halve the bandwidth they eat.
+FLOAT_FIELDS = ("arr_delay", "dep_delay", "taxi_out", "taxi_in")
+FLAG_FIELDS = ("cancelled", "diverted")
+# Few distinct values over millions of rows: dictionary-encode once so the
+# group-by keys hash as small integer codes instead of Python strings.
+CATEGORY_FIELDS = ("carrier", "origin", "destination", "tail_number")
+
 # Configure the overall Streamlit page (title + wide layout for charts).
 st.set_page_config(page_title="BTS Flight Reliability", layout="wide")
 
@@ -28,20 +53,116 @@ def get_client():
     return client
 
 
+def _fetch_frame(
+    collection_name: str,
+    query: dict,
+    fields: tuple[str, ...] | None,
+    sort_by: str | None,
+) -> pd.DataFrame:
+    """Query Mongo and normalize dtypes once before a frame enters the cache.
+
+    When pymongoarrow is installed, BSON is decoded columnwise into Arrow
+    batches instead of one Python dict per row, which skips per-row object
+    allocation and pandas dtype re-inference.
+    """
+
+    projection = {"_id": 0}
+    if fields:
+        projection.update({field: 1 for field in fields})
+    sort = [(sort_by, 1)] if sort_by else None
+    client = get_client()
+    database = client[settings.database]
+    if find_arrow_all is not None:
+        table = find_arrow_all(database[collection_name], query, projection=projection, sort=sort)
+        frame = table.to_pandas()
+    else:
+        frame = pd.DataFrame(list(database[collection_name].find(query, projection, sort=sort)))
+    for column in FLOAT_FIELDS:
+        if column in frame:
+            values = pd.to_numeric(frame[column], errors="coerce")
+            # Rebuild each metric as its own C-contiguous 1D array; a column
+            # sliced out of a consolidated 2D block strides across rows and
+            # can degrade the multi-agg group-bys badly.
+            frame[column] = np.ascontiguousarray(values.to_numpy(np.float32))
+    if "crs_dep_time" in frame:
+        # Required int in the clean schema; int16 comfortably covers HHMM.
+        values = pd.to_numeric(frame["crs_dep_time"], errors="coerce")
+        target = np.float32 if values.isna().any() else np.int16
+        frame["crs_dep_time"] = np.ascontiguousarray(values.to_numpy(target))
+    for column in FLAG_FIELDS:
+        if column in frame:
+            frame[column] = frame[column].astype(bool)
+    for column in CATEGORY_FIELDS:
+        if column in frame:
+            frame[column] = frame[column].astype("category")
+    if "flight_date" in frame:
+        # The clean stage stores BSON Dates, so this is usually a no-op
+        # dtype check; gold collections with date strings parse once per
+        # cache fill instead of once per widget interaction.
+        frame["flight_date"] = pd.to_datetime(frame["flight_date"])
+    return frame
+
+
 @st.cache_data(ttl=60, show_spinner=False)
-def load_collection(collection_name: str) -> pd.DataFrame:
+def load_collection(
+    collection_name: str,
+    fields: tuple[str, ...] | None = None,
+    sort_by: str | None = None,
+) -> pd.DataFrame:
     """Load a MongoDB collection into a pandas DataFrame.
 
     Results are cached for 60 seconds to avoid hitting the database on
     every widget interaction while still keeping the data reasonably fresh.
+    `fields` limits the projection so Mongo only ships the columns a view
+    actually plots; the tuple participates in the cache key, so two views
+    asking for different slices cache independently. `sort_by` asks Mongo
+    for an index-ordered cursor so sorted-key group-bys stay linear scans.
+    """
+
+    return _fetch_frame(collection_name, {}, fields, sort_by)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_filtered(
+    collection_name: str,
+    match: tuple[tuple[str, str], ...],
+    fields: tuple[str, ...] | None = None,
+    sort_by: str | None = None,
+) -> pd.DataFrame:
+    """Load the rows matching a single selection, filtered server-side.
+
+    `match` is a tuple of (field, value) pairs so it can key the cache;
+    it becomes the find() filter, which the indexed carrier/origin/
+    destination lookups serve without scanning the full collection.
+    """
+
+    return _fetch_frame(collection_name, dict(match), fields, sort_by)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def run_pipeline(collection_name: str, pipeline: list) -> pd.DataFrame:
+    """Run a Mongo aggregation pipeline and return the reduced rows.
+
+    Pushing $match/$group server-side means only aggregate rows cross the
+    wire instead of the full fact table; results are cached like
+    load_collection.
     """
 
     client = get_client()
     database = client[settings.database]
-    frame = pd.DataFrame(list(database[collection_name].find({}, {"_id": 0})))
-    return frame
+    return pd.DataFrame(list(database[collection_name].aggregate(pipeline, allowDiskUse=True)))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def distinct_values(collection_name: str, field: str) -> list:
+    """Return the sorted distinct values of a field via an index-served query."""
 
+    client = get_client()
+    database = client[settings.database]
+    return sorted(value for value in database[collection_name].distinct(field) if value is not None)
 
+
+@st.fragment
 def carrier_view():
     """Show daily average departure and arrival delays by carrier."""
 
@@ -50,14 +171,14 @@ def carrier_view():
     if frame.empty:
         st.info("Run the aggregation stage to populate this view.")
         return
-    carrier = st.selectbox("Carrier", sorted(frame["carrier"].unique()))
+    carrier = st.selectbox("Carrier", distinct_values(settings.agg_carrier_collection, "carrier"))
     filtered = frame[frame["carrier"] == carrier].sort_values("flight_date")
-    # Convert flight_date to string for better axis formatting if needed
-    if pd.api.types.is_datetime64_any_dtype(filtered["flight_date"]):
-        filtered["flight_date"] = filtered["flight_date"].dt.strftime("%Y-%m-%d")
+    # Vega renders datetime64 columns as proper temporal axes, so no
+    # per-row strftime round trip is needed before plotting.
     st.line_chart(filtered, x="flight_date", y=["avg_dep_delay", "avg_arr_delay"])
 
 
+@st.fragment
 def origin_view():
     """Display cancellation rate by origin airport from gold aggregates."""
 
@@ -70,6 +191,7 @@ def origin_view():
     st.bar_chart(frame.head(limit), x="origin", y="cancel_rate")
 
 
+@st.fragment
 def route_view():
     """Tabular preview of route-level delay and volume metrics."""
 
@@ -78,20 +200,24 @@ def route_view():
     if frame.empty:
         st.info("Aggregation data missing.")
         return
-    frame["route"] = frame["origin"] + " → " + frame["destination"]
+    # The aggregation stage materializes the route label, so the render
+    # path never concatenates strings row by row.
     st.dataframe(frame[["route", "avg_arr_delay", "avg_dep_delay", "flights"]].head(25))
 
 
+@st.fragment
 def on_time_scorecard_view():
     """High-level KPIs summarizing fleet on-time performance."""
 
     st.subheader("On-Time Performance Scorecard")
-    frame = load_collection(settings.clean_collection)
+    frame = load_collection(
+        settings.clean_collection,
+        fields=("flight_date", "arr_delay", "cancelled", "diverted"),
+    )
     if frame.empty:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    arr = pd.to_numeric(frame["arr_delay"], errors="coerce")
+    arr = frame["arr_delay"]
     total_flights = len(frame)
     on_time_15 = (arr <= 15).mean()
     avg_delay = arr.mean()
@@ -106,24 +232,31 @@ def on_time_scorecard_view():
     c5.metric("Diversion rate", f"{divert_rate * 100:0.2f}%")
 
 
+@st.fragment
 def delay_waterfall_view():
     """Break down average delay for one airline into key components."""
 
     st.subheader("Delay Waterfall (Schedule vs Actual)")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    carriers = distinct_values(settings.clean_collection, "carrier")
+    if not carriers:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    carrier = st.selectbox("Airline", sorted(frame["carrier"].dropna().unique()))
-    subset = frame[frame["carrier"] == carrier]
+    carrier = st.selectbox("Airline", carriers)
+    # The indexed $match runs in Mongo, so only one airline's rows (and only
+    # the four delay components) ever reach pandas.
+    subset = load_filtered(
+        settings.clean_collection,
+        (("carrier", carrier),),
+        fields=("dep_delay", "taxi_out", "taxi_in", "arr_delay"),
+    )
     if subset.empty:
         st.info("No data for selected airline.")
         return
 
-    dep = pd.to_numeric(subset["dep_delay"], errors="coerce").mean()
-    taxi_out = pd.to_numeric(subset["taxi_out"], errors="coerce").mean()
-    taxi_in = pd.to_numeric(subset["taxi_in"], errors="coerce").mean()
-    arr = pd.to_numeric(subset["arr_delay"], errors="coerce").mean()
+    dep = subset["dep_delay"].mean()
+    taxi_out = subset["taxi_out"].mean()
+    taxi_in = subset["taxi_in"].mean()
+    arr = subset["arr_delay"].mean()
     airborne = arr - dep - taxi_out - taxi_in
 
     parts = pd.DataFrame(
@@ -140,28 +273,39 @@ def delay_waterfall_view():
     st.bar_chart(parts, x="component", y="minutes")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _route_risk_agg() -> pd.DataFrame:
+    """Pre-aggregate route risk metrics once; the selectbox filters the result."""
+
+    frame = load_collection(
+        settings.clean_collection,
+        fields=("carrier", "origin", "destination", "arr_delay", "cancelled", "flight_date"),
+    )
+    if frame.empty:
+        return frame
+    frame["is_delayed15"] = frame["arr_delay"] >= 15
+    # observed=True keeps the output to combinations that actually fly
+    # instead of the full categorical cross product.
+    return frame.groupby(["carrier", "origin", "destination"], as_index=False, observed=True).agg(
+        avg_delay=("arr_delay", "mean"),
+        cancel_rate=("cancelled", "mean"),
+        flights=("flight_date", "count"),
+        delayed_share=("is_delayed15", "mean"),
+    )
+
+
+@st.fragment
 def route_risk_matrix_view():
     """Bubble chart of route-level delay and cancellation risk for one carrier."""
 
     st.subheader("Route Profitability Risk Matrix")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    grouped = _route_risk_agg()
+    if grouped.empty:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
-    frame["is_delayed15"] = frame["arr_delay_num"] >= 15
-    grouped = (
-        frame.groupby(["carrier", "origin", "destination"], as_index=False)
-        .agg(
-            avg_delay=("arr_delay_num", "mean"),
-            cancel_rate=("cancelled", "mean"),
-            flights=("flight_date", "count"),
-            delayed_share=("is_delayed15", "mean"),
-        )
-    )
     airline = st.selectbox(
         "Airline (risk matrix)",
-        sorted(grouped["carrier"].dropna().unique()),
+        distinct_values(settings.clean_collection, "carrier"),
     )
     subset = grouped[grouped["carrier"] == airline]
     if subset.empty:
@@ -182,27 +326,37 @@ def route_risk_matrix_view():
     st.altair_chart(chart, use_container_width=True)
 
 
+@st.fragment
 def airport_congestion_heatmap_view():
     """Heatmap showing average delay by day-of-week and hour for a station."""
 
     st.subheader("Airport Congestion Heatmap (Hour × Day-of-week)")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    airports = distinct_values(settings.clean_collection, "origin")
+    if not airports:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    frame["dow"] = frame["flight_date"].dt.day_name()
-    hours = (pd.to_numeric(frame["crs_dep_time"], errors="coerce") // 100).astype("Int64")
-    frame["hour"] = hours
-    airport = st.selectbox("Airport (origin)", sorted(frame["origin"].dropna().unique()))
-    subset = frame[frame["origin"] == airport]
+    airport = st.selectbox("Airport (origin)", airports)
+    # $match leads the pipeline so the indexed origin lookup ships only one
+    # airport's rows (and only the three needed fields); the day/hour
+    # derivation stays client-side on that small subset.
+    subset = run_pipeline(
+        settings.clean_collection,
+        [
+            {"$match": {"origin": airport}},
+            {"$project": {"_id": 0, "flight_date": 1, "crs_dep_time": 1, "arr_delay": 1}},
+        ],
+    )
     if subset.empty:
         st.info("No data for selected airport.")
         return
-    subset["arr_delay_num"] = pd.to_numeric(subset["arr_delay"], errors="coerce")
+    subset["flight_date"] = pd.to_datetime(subset["flight_date"])
+    subset["dow"] = subset["flight_date"].dt.day_name()
+    # crs_dep_time is a required int in the clean schema, so plain numpy
+    # int math applies here and the groupby stays off the masked-dtype path.
+    subset["hour"] = (subset["crs_dep_time"].to_numpy() // 100).astype(np.int16)
     heat = (
         subset.groupby(["dow", "hour"], as_index=False)
-        .agg(avg_delay=("arr_delay_num", "mean"))
+        .agg(avg_delay=("arr_delay", "mean"))
     )
     dow_order = [
         "Monday",
@@ -227,109 +381,167 @@ def airport_congestion_heatmap_view():
     st.altair_chart(chart, use_container_width=True)
 
 
+@st.fragment
 def missed_connection_risk_view():
     """Trend of share of flights arriving 30/45/60+ minutes late into a hub."""
 
     st.subheader("Missed Connection Risk Proxy")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    hubs = distinct_values(settings.clean_collection, "destination")
+    if not hubs:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
-    frame["late_30"] = frame["arr_delay_num"] >= 30
-    frame["late_45"] = frame["arr_delay_num"] >= 45
-    frame["late_60"] = frame["arr_delay_num"] >= 60
-    hub = st.selectbox("Destination hub", sorted(frame["destination"].dropna().unique()))
-    subset = frame[frame["destination"] == hub]
+    hub = st.selectbox("Destination hub", hubs)
+    subset = load_filtered(
+        settings.clean_collection,
+        (("destination", hub),),
+        fields=("arr_delay", "flight_date"),
+    )
     if subset.empty:
         st.info("No data for selected hub.")
         return
-    summary = (
-        subset.groupby("flight_date", as_index=False)
-        .agg(
-            share_30=("late_30", "mean"),
-            share_45=("late_45", "mean"),
-            share_60=("late_60", "mean"),
-        )
-        .sort_values("flight_date")
+    # One fused accumulation pass replaces three boolean columns plus a
+    # three-agg groupby: column 0 counts flights per day, columns 1-3 count
+    # the late buckets, and a single divide yields all three shares.
+    codes, days = pd.factorize(subset["flight_date"], sort=True)
+    delays = subset["arr_delay"].to_numpy()
+    # NaT days factorize to -1, which would wrap around and corrupt the
+    # last day's counters; mask them out like the other kernel call sites.
+    present = codes >= 0
+    codes = codes[present]
+    delays = delays[present]
+    counts = np.zeros((len(days), 4), dtype=np.int64)
+    np.add.at(counts, (codes, 0), 1)
+    np.add.at(counts, (codes, 1), delays >= 30)
+    np.add.at(counts, (codes, 2), delays >= 45)
+    np.add.at(counts, (codes, 3), delays >= 60)
+    shares = counts[:, 1:] / counts[:, :1]
+    summary = pd.DataFrame(
+        {
+            "flight_date": days,
+            "share_30": shares[:, 0],
+            "share_45": shares[:, 1],
+            "share_60": shares[:, 2],
+        }
     )
     st.line_chart(summary, x="flight_date", y=["share_30", "share_45", "share_60"])
 
 
+@st.fragment
 def airline_benchmark_view():
     """League table comparing on-time performance across carriers."""
 
     st.subheader("Airline Benchmarking League Table")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
-        st.info("Clean data missing. Run ingest + clean stages.")
+    # The aggregation stage materializes this league table, so only ~a dozen
+    # pre-sorted rows are read and the slider filters a tiny cached frame.
+    summary = load_collection(settings.agg_carrier_ontime_collection)
+    if summary.empty:
+        st.info("Aggregation data missing.")
         return
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
-    frame["on_time"] = frame["arr_delay_num"] <= 15
-    summary = (
-        frame.groupby("carrier", as_index=False)
-        .agg(on_time_rate=("on_time", "mean"), flights=("flight_date", "count"))
-    )
     min_flights = st.slider("Minimum flights", min_value=100, max_value=int(summary["flights"].max()), value=1000)
     summary = summary[summary["flights"] >= min_flights]
-    summary = summary.sort_values("on_time_rate", ascending=False)
     st.dataframe(summary)
 
 
+@st.fragment
 def control_chart_view():
     """Control chart for average delay over time for a route or airport."""
 
     st.subheader("Control Chart for Route or Airport")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
-        st.info("Clean data missing. Run ingest + clean stages.")
-        return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
     mode = st.radio("Control chart for", ["Route", "Airport"], horizontal=True)
     if mode == "Route":
-        frame["route"] = frame["origin"] + " → " + frame["destination"]
-        choice = st.selectbox("Route", sorted(frame["route"].dropna().unique()))
-        subset = frame[frame["route"] == choice]
+        # The route gold collection already carries one label per route, so
+        # the choices come for free and the clean read is a two-key $match.
+        routes = distinct_values(settings.agg_route_collection, "route")
+        if not routes:
+            st.info("Aggregation data missing.")
+            return
+        choice = st.selectbox("Route", routes)
+        origin, destination = choice.split(" → ")
+        subset = load_filtered(
+            settings.clean_collection,
+            (("origin", origin), ("destination", destination)),
+            fields=("flight_date", "arr_delay"),
+        )
     else:
-        choice = st.selectbox("Airport", sorted(frame["origin"].dropna().unique()))
-        subset = frame[frame["origin"] == choice]
+        airports = distinct_values(settings.clean_collection, "origin")
+        if not airports:
+            st.info("Clean data missing. Run ingest + clean stages.")
+            return
+        choice = st.selectbox("Airport", airports)
+        subset = load_filtered(
+            settings.clean_collection,
+            (("origin", choice),),
+            fields=("flight_date", "arr_delay"),
+        )
     if subset.empty:
         st.info("No data for selection.")
         return
-    daily = (
-        subset.groupby("flight_date", as_index=False)
-        .agg(avg_delay=("arr_delay_num", "mean"))
-        .sort_values("flight_date")
-    )
+    if segment_mean is not None:
+        # Factorize the days once and let the compiled kernel accumulate
+        # sum and count in a single pass over the delay column. NaT days
+        # factorize to code -1 and must stay out of the accumulators.
+        codes, days = pd.factorize(subset["flight_date"], sort=True)
+        present = codes >= 0
+        means = segment_mean(
+            codes[present].astype(np.int64),
+            subset["arr_delay"].to_numpy(np.float64)[present],
+            len(days),
+        )
+        daily = pd.DataFrame({"flight_date": days, "avg_delay": means})
+    else:
+        daily = (
+            subset.groupby("flight_date", as_index=False)
+            .agg(avg_delay=("arr_delay", "mean"))
+            .sort_values("flight_date")
+        )
     mean = daily["avg_delay"].mean()
     std = daily["avg_delay"].std()
-    daily["ucl"] = mean + 3 * std
-    daily["lcl"] = mean - 3 * std
+    # The control limits are scalars, so encode them with alt.datum rather
+    # than materializing two constant columns into the chart payload.
     base = alt.Chart(daily).encode(x="flight_date:T")
     line = base.mark_line().encode(y="avg_delay:Q")
     center = base.mark_rule(color="green").encode(y=alt.datum(mean))
-    band = base.mark_area(opacity=0.2, color="red").encode(y="lcl:Q", y2="ucl:Q")
+    band = base.mark_area(opacity=0.2, color="red").encode(
+        y=alt.datum(mean - 3 * std), y2=alt.datum(mean + 3 * std)
+    )
     st.altair_chart(band + center + line, use_container_width=True)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _pareto_by_dim(dim: str) -> pd.DataFrame:
+    """Sum positive delay minutes per value of one dimension, cached per dim."""
+
+    if dim == "origin":
+        # The aggregation stage materializes the origin Pareto; other
+        # dimensions still reduce the (projected) clean collection here.
+        return load_collection(settings.agg_pareto_origin_collection)
+    frame = load_collection(settings.clean_collection, fields=(dim, "arr_delay"))
+    if frame.empty:
+        return frame
+    frame = frame[frame["arr_delay"] > 0]
+    # The loader dictionary-encoded the dimension, so summing per category
+    # code is one bincount pass over the weights — no hash table at all.
+    keys = frame[dim]
+    codes = keys.cat.codes.to_numpy()
+    weights = frame["arr_delay"].to_numpy()
+    present = codes >= 0  # -1 codes are missing values (e.g. tail numbers)
+    sums = np.bincount(codes[present], weights=weights[present], minlength=len(keys.cat.categories))
+    grouped = pd.DataFrame({dim: keys.cat.categories, "delay_minutes": sums})
+    grouped = grouped[grouped["delay_minutes"] > 0].sort_values("delay_minutes", ascending=False)
+    grouped["cum_share"] = grouped["delay_minutes"].cumsum() / grouped["delay_minutes"].sum()
+    return grouped
+
+
+@st.fragment
 def pareto_delay_view():
     """Pareto chart showing which dimensions contribute most delay minutes."""
 
     st.subheader("Pareto of Delay Contributors")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    dim = st.selectbox("Dimension", ["origin", "destination", "tail_number"])
+    grouped = _pareto_by_dim(dim)
+    if grouped.empty:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
-    frame = frame[frame["arr_delay_num"] > 0]
-    dim = st.selectbox("Dimension", ["origin", "destination", "tail_number"])
-    grouped = (
-        frame.groupby(dim, as_index=False)
-        .agg(delay_minutes=("arr_delay_num", "sum"))
-        .sort_values("delay_minutes", ascending=False)
-    )
-    grouped["cum_share"] = grouped["delay_minutes"].cumsum() / grouped["delay_minutes"].sum()
     top_n = st.slider("Top N", min_value=5, max_value=min(50, len(grouped)), value=20)
     subset = grouped.head(top_n)
     bars = alt.Chart(subset).mark_bar().encode(x=dim, y="delay_minutes")
@@ -341,19 +553,22 @@ def pareto_delay_view():
     st.altair_chart(bars + line, use_container_width=True)
 
 
+@st.fragment
 def disruption_map_view():
     """Rank origins by average delay and cancellation to highlight hotspots."""
 
     st.subheader("Disruption Map (Tabular Proxy)")
-    frame = load_collection(settings.clean_collection)
+    frame = load_collection(
+        settings.clean_collection,
+        fields=("origin", "arr_delay", "cancelled", "flight_date"),
+    )
     if frame.empty:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["arr_delay_num"] = pd.to_numeric(frame["arr_delay"], errors="coerce")
     summary = (
-        frame.groupby("origin", as_index=False)
+        frame.groupby("origin", as_index=False, observed=True)
         .agg(
-            avg_delay=("arr_delay_num", "mean"),
+            avg_delay=("arr_delay", "mean"),
             cancel_rate=("cancelled", "mean"),
             flights=("flight_date", "count"),
         )
@@ -362,24 +577,29 @@ def disruption_map_view():
     st.dataframe(summary.head(50))
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _daily_volume() -> pd.DataFrame:
+    """Read the per-day counts materialized by the aggregation stage."""
+
+    frame = load_collection(settings.agg_daily_volume_collection)
+    if frame.empty:
+        return frame
+    return frame.sort_values("flight_date")
+
+
+@st.fragment
 def daily_volume_view():
     """Plot total number of flights per day across all carriers."""
 
     st.subheader("Daily Flight Volume (All Carriers)")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
-        st.info("Clean data missing. Run ingest + clean stages.")
+    daily = _daily_volume()
+    if daily.empty:
+        st.info("Aggregation data missing.")
         return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    daily = (
-        frame.groupby(frame["flight_date"].dt.date)
-        .size()
-        .reset_index(name="flights")
-        .sort_values("flight_date")
-    )
     st.line_chart(daily, x="flight_date", y="flights")
 
 
+@st.fragment
 def top_delayed_routes_view():
     """Bar chart of the N routes with the highest average arrival delay."""
 
@@ -388,30 +608,19 @@ def top_delayed_routes_view():
     if frame.empty:
         st.info("Aggregation data missing.")
         return
-    frame["route"] = frame["origin"] + " → " + frame["destination"]
     max_n = min(100, len(frame)) if len(frame) > 0 else 10
     top_n = st.slider("How many routes?", min_value=5, max_value=max_n, value=min(10, max_n))
     top = frame.sort_values("avg_arr_delay", ascending=False).head(top_n)
     st.bar_chart(top, x="route", y="avg_arr_delay")
 
 
-def dow_cancellation_view():
-    """Show how cancellation rate changes across the days of the week."""
+@st.cache_data(ttl=60, show_spinner=False)
+def _dow_cancel_summary() -> pd.DataFrame:
+    """Read the weekday cancellation rollup and restore the Monday-first order."""
 
-    st.subheader("Cancellation Rate by Day of Week")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
-        st.info("Clean data missing. Run ingest + clean stages.")
-        return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    frame["dow"] = frame["flight_date"].dt.day_name()
-    summary = (
-        frame.groupby("dow", as_index=False)
-        .agg(
-            cancel_rate=("cancelled", "mean"),
-            flights=("flight_date", "count"),
-        )
-    )
+    summary = load_collection(settings.agg_dow_cancel_collection)
+    if summary.empty:
+        return summary
     order = [
         "Monday",
         "Tuesday",
@@ -422,56 +631,110 @@ def dow_cancellation_view():
         "Sunday",
     ]
     summary["dow"] = pd.Categorical(summary["dow"], categories=order, ordered=True)
-    summary = summary.sort_values("dow")
+    return summary.sort_values("dow")
+
+
+@st.fragment
+def dow_cancellation_view():
+    """Show how cancellation rate changes across the days of the week."""
+
+    st.subheader("Cancellation Rate by Day of Week")
+    summary = _dow_cancel_summary()
+    if summary.empty:
+        st.info("Aggregation data missing.")
+        return
     st.bar_chart(summary, x="dow", y="cancel_rate")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _dep_delay_hist() -> pd.DataFrame:
+    """Bin departure delays once; the pd.cut pass only reruns when data changes."""
+
+    frame = load_collection(settings.clean_collection, fields=("dep_delay",))
+    if frame.empty:
+        return frame
+    delays = frame["dep_delay"].dropna()
+    if delays.empty:
+        return pd.DataFrame()
+    # Use 20 equal-width bins over the observed delay range; np.histogram
+    # counts them in one C pass with no Interval objects to group or sort.
+    counts, edges = np.histogram(delays.to_numpy(), bins=20)
+    labels = [f"[{edges[i]:.0f}, {edges[i + 1]:.0f})" for i in range(len(counts))]
+    return pd.DataFrame({"bin_label": labels, "flights": counts})
+
+
+@st.fragment
 def dep_delay_distribution_view():
     """Histogram-style view of the overall departure delay distribution."""
 
     st.subheader("Distribution of Departure Delays")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    hist_df = _dep_delay_hist()
+    if hist_df.empty:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    delays = pd.to_numeric(frame["dep_delay"], errors="coerce").dropna()
-    if delays.empty:
-        st.info("No departure delay data available.")
-        return
-    # Use 20 equal-width bins over the observed delay range
-    hist = pd.cut(delays, bins=20).value_counts().sort_index()
-    hist_df = hist.reset_index()
-    hist_df.columns = ["bin", "flights"]
-    hist_df["bin_label"] = hist_df["bin"].astype(str)
     st.bar_chart(hist_df, x="bin_label", y="flights")
 
 
+@st.fragment
 def ontime_by_month_view():
     """Daily on-time rate for a selected carrier across the time range."""
 
     st.subheader("Daily On-Time Performance by Carrier")
-    frame = load_collection(settings.clean_collection)
-    if frame.empty:
+    carriers = distinct_values(settings.clean_collection, "carrier")
+    if not carriers:
         st.info("Clean data missing. Run ingest + clean stages.")
         return
-    frame["flight_date"] = pd.to_datetime(frame["flight_date"])
-    frame["flight_day"] = frame["flight_date"].dt.date
-    frame["on_time"] = pd.to_numeric(frame["arr_delay"], errors="coerce") <= 0
-    carrier = st.selectbox(
-        "Carrier (On-Time Rate)", sorted(frame["carrier"].dropna().unique())
+    carrier = st.selectbox("Carrier (On-Time Rate)", carriers)
+    # The carrier/flight_date compound index serves both the $match and the
+    # sort, so the cursor arrives pre-ordered for the linear group-by below.
+    filtered = load_filtered(
+        settings.clean_collection,
+        (("carrier", carrier),),
+        fields=("flight_date", "arr_delay"),
+        sort_by="flight_date",
     )
-    filtered = frame[frame["carrier"] == carrier]
     if filtered.empty:
         st.info("No data for selected carrier.")
         return
-    summary = (
-        filtered.groupby("flight_day", as_index=False)
-        .agg(on_time_rate=("on_time", "mean"), flights=("flight_date", "count"))
-        .sort_values("flight_day")
-    )
+    filtered["flight_day"] = filtered["flight_date"].dt.date
+    filtered["on_time"] = filtered["arr_delay"] <= 0
+    if pl is not None:
+        # Filtering preserves the cursor order, so set_sorted lets Polars
+        # skip hashing and aggregate contiguous day runs directly.
+        summary = (
+            pl.from_pandas(filtered[["flight_day", "on_time"]])
+            .lazy()
+            .set_sorted("flight_day")
+            .group_by("flight_day")
+            .agg(
+                pl.col("on_time").mean().alias("on_time_rate"),
+                pl.len().alias("flights"),
+            )
+            .collect()
+            .to_pandas()
+        )
+    else:
+        summary = (
+            filtered.groupby("flight_day", as_index=False)
+            .agg(on_time_rate=("on_time", "mean"), flights=("flight_date", "count"))
+            .sort_values("flight_day")
+        )
     st.line_chart(summary, x="flight_day", y="on_time_rate")
 
 
-route_risk_matrix_view()
-airport_congestion_heatmap_view()
-top_delayed_routes_view()
+# st.tabs computes every tab body on a full rerun by default, so gate each
+# view on its tab's open state; on_change="rerun" re-executes the script on
+# a tab switch so the newly selected view renders. Only the visible tab
+# pays for its load + group-by.
+risk_tab, congestion_tab, routes_tab = st.tabs(
+    ["Risk Matrix", "Congestion", "Top Routes"], key="main_tabs", on_change="rerun"
+)
+with risk_tab:
+    if risk_tab.open:
+        route_risk_matrix_view()
+with congestion_tab:
+    if congestion_tab.open:
+        airport_congestion_heatmap_view()
+with routes_tab:
+    if routes_tab.open:
+        top_delayed_routes_view()
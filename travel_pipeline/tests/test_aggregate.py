@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
+from travel_pipeline.core.kernels import segment_mean
 from travel_pipeline.aggregate.pipeline import (
+    _carrier_summary_numba,
     carrier_month_summary,
+    carrier_ontime_summary,
+    daily_volume_summary,
+    dow_cancel_summary,
     origin_cancel_summary,
+    pareto_origin_summary,
     route_delay_summary,
 )
 
@@ -41,3 +49,75 @@ def test_origin_cancel_summary_orders_by_cancel_rate():
 def test_route_delay_summary_calculates_route_key_counts():
     summary = route_delay_summary(_frame())
     assert summary.iloc[0]["flights"] >= 1
+
+
+def test_carrier_ontime_summary_ranks_by_on_time_rate():
+    summary = carrier_ontime_summary(_frame())
+    # Every sample delay is within 15 minutes, so both carriers are perfect.
+    assert summary.iloc[0]["on_time_rate"] == 1.0
+    assert set(summary["carrier"]) == {"AA", "DL"}
+
+
+def test_dow_cancel_summary_labels_weekdays():
+    summary = dow_cancel_summary(_frame())
+    # 2025-02-01 is a Saturday and carries the only cancellation.
+    saturday = summary[summary["dow"] == "Saturday"]
+    assert saturday.iloc[0]["cancel_rate"] == 1.0
+    assert set(summary["dow"]) == {"Wednesday", "Saturday", "Sunday"}
+
+
+def test_daily_volume_summary_counts_each_day():
+    summary = daily_volume_summary(_frame())
+    assert summary["flights"].sum() == 3
+    assert list(summary["flight_date"]) == sorted(summary["flight_date"])
+
+
+def test_pareto_origin_summary_cum_share_reaches_one():
+    summary = pareto_origin_summary(_frame())
+    # Only the positive delays contribute; JFK's 10 minutes lead ATL's 3.
+    assert summary.iloc[0]["origin"] == "JFK"
+    assert summary.iloc[-1]["cum_share"] == 1.0
+
+
+@pytest.mark.skipif(segment_mean is None, reason="numba not installed")
+def test_segment_mean_skips_nan_values_and_empty_groups():
+    codes = np.array([0, 0, 2], dtype=np.int64)
+    values = np.array([10.0, np.nan, 4.0])
+    means = segment_mean(codes, values, 3)
+    assert means[0] == 10.0
+    assert np.isnan(means[1])  # group 1 has no rows
+    assert means[2] == 4.0
+
+
+@pytest.mark.skipif(segment_mean is None, reason="numba not installed")
+def test_carrier_summary_numba_matches_groupby_fallback():
+    # Null keys and NaN delays must come out exactly like the pandas path.
+    frame = pd.DataFrame(
+        {
+            "carrier": ["AA", "AA", None, "DL"],
+            "flight_date": ["2025-01-01", "2025-01-01", "2025-01-01", "2025-01-02"],
+            "arr_delay": [10.0, None, 99.0, 4.0],
+            "dep_delay": [8.0, 2.0, 99.0, 3.0],
+            "cancelled": [False, True, True, False],
+        }
+    )
+    grouped = frame.groupby(["carrier", "flight_date"], sort=False, observed=True)
+    expected = (
+        pd.DataFrame(
+            {
+                "avg_arr_delay": grouped["arr_delay"].mean(),
+                "avg_dep_delay": grouped["dep_delay"].mean(),
+                "flights": grouped.size(),
+                "cancel_rate": grouped["cancelled"].mean(),
+            }
+        )
+        .reset_index()
+        .sort_values(["carrier", "flight_date"])
+        .reset_index(drop=True)
+    )
+    result = (
+        _carrier_summary_numba(frame)
+        .sort_values(["carrier", "flight_date"])
+        .reset_index(drop=True)
+    )
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)